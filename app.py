@@ -0,0 +1,38 @@
+from flask import Flask, request, jsonify
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.pipeline.prediction_pipeline import PredictionPipeline
+
+app = Flask(__name__)
+
+# One loaded pipeline per requested backend (None -> backend from config.yaml)
+pipelines = {}
+
+
+def get_pipeline(backend=None) -> PredictionPipeline:
+    if backend not in pipelines:
+        pipelines[backend] = PredictionPipeline(backend=backend)
+    return pipelines[backend]
+
+
+@app.route("/predict", methods=["POST"])
+def predict():
+    """
+    Score rows posted as {"instances": [[...], ...], "backend": "sklearn" | "kernel"}.
+    Rows must be in the model's feature order; "backend" is optional.
+    """
+    payload = request.get_json(force=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    if not isinstance(payload.get("backend"), (str, type(None))):
+        return jsonify({"error": "\"backend\" must be a string"}), 400
+    try:
+        predictions = get_pipeline(payload.get("backend")).predict(payload["instances"])
+    except (KeyError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    # One line per request would dominate the log under load; keep every 100th
+    logger.info("Scored %d rows", len(predictions), extra={"sample_every": 100})
+    return jsonify({"predictions": predictions.tolist()})
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=8080)
@@ -3,6 +3,8 @@ from src.end_to_end_ml_pipeline.pipeline.data_ingestion_pipeline import DataInge
 from src.end_to_end_ml_pipeline.pipeline.data_validation_pipeline import DataValidationPipeline
 from src.end_to_end_ml_pipeline.pipeline.data_transformation_pipeline import TransformationPipeline
 from src.end_to_end_ml_pipeline.pipeline.model_trainer_pipeline import ModelTrainerPipeline
+from src.end_to_end_ml_pipeline.pipeline.model_export_pipeline import ModelExportPipeline
+from src.end_to_end_ml_pipeline.pipeline.run_snapshot_pipeline import RunSnapshotPipeline
 
 
 
@@ -49,4 +51,26 @@ try:
     logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
     logger.exception(e)
-    raise e 
\ No newline at end of file
+    raise e
+
+STAGE_NAME = "Model Export Stage"
+try:
+    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+    model_export_pipeline = ModelExportPipeline()
+    model_export_pipeline.initiate_model_export()
+
+    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+STAGE_NAME = "Run Snapshot Stage"
+try:
+    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+    run_snapshot_pipeline = RunSnapshotPipeline()
+    run_snapshot_pipeline.initiate_run_snapshot()
+
+    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+    logger.exception(e)
+    raise e
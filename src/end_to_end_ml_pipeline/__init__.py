@@ -1,24 +1,18 @@
-import os
-import sys
 import logging
+from src.end_to_end_ml_pipeline.utils.logging_setup import configure_logging
 
 # 1. Define a log format
 logging_str = "[%(asctime)s: %(levelname)s: %(module)s]: %(message)s"
 
-# 2. Make sure logs/ exists
+# 2. Where logs go (logs/ is created if missing)
 log_dir = "logs"
-log_file_path = os.path.join(log_dir, "logging_file.log")
-os.makedirs(log_dir, exist_ok=True)
+log_file_name = "logging_file.log"
 
-# 3. Configure root logging once
-logging.basicConfig(
-    level=logging.INFO,
-    format=logging_str,
-    handlers=[
-        logging.FileHandler(log_file_path),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+# 3. Configure root logging once.
+#    Synchronous file + stdout handlers by default; set PIPELINE_LOG_QUEUE=1 for
+#    non-blocking queue logging with per-process files and PIPELINE_LOG_FORMAT=json
+#    for JSON lines (see utils/logging_setup.py).
+configure_logging(log_dir=log_dir, log_file_name=log_file_name, fmt=logging_str)
 
 # 4. Create a named logger for this package
 logger = logging.getLogger("end_to_end_ml_pipeline")
@@ -1,9 +1,29 @@
 import os
+import glob
+import hashlib
+import shutil
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
+import pandas as pd
 from src.end_to_end_ml_pipeline import logger
 from src.end_to_end_ml_pipeline.entity.config_entity import (DataIngestionConfig)
+from src.end_to_end_ml_pipeline.utils.common import save_json
+
+URL_SCHEMES = {"http", "https", "ftp", "file"}
+
+
+def is_url(source: str) -> bool:
+    """Return True if `source` should be downloaded rather than read from disk."""
+    return urlparse(source).scheme in URL_SCHEMES
+
+
+def _csv_row_count(path: Path) -> int:
+    """Number of data rows in a CSV, parsing only its first column."""
+    return len(pd.read_csv(path, usecols=[0]))
+
 
 class DataIngestion:
     def __init__(self, config: DataIngestionConfig):
@@ -25,10 +45,10 @@ class DataIngestion:
                 url = self.config.source_URL, 
                 filename = self.config.local_data_file
             )
-            logger.info(f"File downloaded successfully into {filename}")
+            logger.info("File downloaded successfully into %s", filename)
 
         else:
-            logger.info(f"File already exists at {self.config.local_data_file}. Skipping download.")
+            logger.info("File already exists at %s. Skipping download.", self.config.local_data_file)
 
     def extract_zip_file(self) -> None:
         """
@@ -38,6 +58,170 @@ class DataIngestion:
         os.makedirs(unzip_dir, exist_ok=True)
         with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
             zip_ref.extractall(self.config.unzip_dir)
-            logger.info(f"File extracted successfully into {self.config.unzip_dir}")
+            logger.info("File extracted successfully into %s", self.config.unzip_dir)
+
+    def resolve_sources(self) -> list:
+        """
+        Expand `source_URL` into an ordered list of concrete sources.
+
+        `source_URL` may be a single entry or a list. URLs are kept as-is; anything
+        else is treated as a local path or glob pattern and expanded in sorted order.
+
+        Returns:
+            list: Source URLs and local archive paths, duplicates removed.
+
+        Raises:
+            FileNotFoundError: If a local path or glob matches nothing.
+            ValueError: If `source_URL` resolves to no sources at all.
+        """
+        entries = self.config.source_URL
+        if isinstance(entries, (str, Path)):
+            entries = [entries]
+
+        sources = []
+        for entry in entries:
+            entry = str(entry)
+            if is_url(entry):
+                matches = [entry]
+            else:
+                matches = sorted(glob.glob(entry))
+                if not matches:
+                    raise FileNotFoundError(f"No source archives match: {entry}")
+            for match in matches:
+                if match not in sources:
+                    sources.append(match)
+
+        if not sources:
+            raise ValueError("data_ingestion.source_URL resolved to no sources")
+        return sources
+
+    def _partition_names(self, sources: list) -> list:
+        """
+        Derive a filesystem-safe partition name for each source: its file name plus a
+        short hash of the full URL or path.
+
+        The name also keys the cached archive, so `.../eu/data.zip` and `.../us/data.zip`
+        never share a download, and reordering or swapping sources never reuses the
+        wrong one.
+        """
+        names = []
+        for source in sources:
+            stem = Path(urlparse(source).path if is_url(source) else source).stem or "source"
+            names.append(f"{stem}_{hashlib.sha256(source.encode()).hexdigest()[:8]}")
+        return names
+
+    def _fetch_and_extract(self, source: str, archive_path: Path, extract_dir: Path) -> list:
+        """
+        Download (for URLs) and extract one source archive.
+
+        Returns:
+            list: Relative paths of the extracted files.
+        """
+        if is_url(source):
+            if not os.path.exists(archive_path):
+                urllib.request.urlretrieve(url=source, filename=archive_path)
+                logger.info("File downloaded successfully into %s", archive_path)
+            else:
+                logger.info("File already exists at %s. Skipping download.", archive_path)
+        else:
+            archive_path = Path(source)
+
+        os.makedirs(extract_dir, exist_ok=True)
+        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+            zip_ref.extractall(extract_dir)
+            members = [info.filename for info in zip_ref.infolist() if not info.is_dir()]
+        logger.info("%s extracted successfully into %s", source, extract_dir)
+        return members
+
+    def ingest_sources(self) -> dict:
+        """
+        Download and extract every configured source, then merge them.
+
+        Sources are fetched concurrently on a bounded thread pool. A single source is
+        extracted straight into `unzip_dir`, as before. Several sources are each
+        extracted into `partitions_dir/<name>/`, and every CSV is concatenated (in
+        source order) into `unzip_dir` under its original relative path.
+
+        A provenance file records, per CSV in `unzip_dir`, the row range each source
+        contributed; a single source is recorded the same way with one range.
+
+        Returns:
+            dict: The provenance record written to `provenance_file`.
+        """
+        sources = self.resolve_sources()
+        names = self._partition_names(sources)
+        single = len(sources) == 1
+
+        local_data_file = Path(self.config.local_data_file)
+        jobs = []
+        for source, name in zip(sources, names):
+            archive_path = local_data_file if single else local_data_file.with_name(f"{name}{local_data_file.suffix}")
+            extract_dir = Path(self.config.unzip_dir) if single else Path(self.config.partitions_dir) / name
+            jobs.append((source, archive_path, extract_dir))
+
+        max_workers = max(1, min(self.config.max_workers, len(jobs)))
+        logger.info("Ingesting %d source(s) with %d worker(s)", len(jobs), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            extracted = list(executor.map(lambda job: self._fetch_and_extract(*job), jobs))
+
+        provenance = {"sources": [], "merged": {}}
+        for (source, _, extract_dir), name, members in zip(jobs, names, extracted):
+            provenance["sources"].append({
+                "name": name,
+                "source": source,
+                "extract_dir": str(extract_dir),
+                "files": members,
+            })
+
+        if single:
+            source = provenance["sources"][0]
+            provenance["merged"] = {
+                member: [{"name": source["name"], "start_row": 0,
+                          "end_row": _csv_row_count(Path(source["extract_dir"]) / member)}]
+                for member in source["files"] if member.lower().endswith(".csv")
+            }
+        else:
+            provenance["merged"] = self._merge_partitions(provenance["sources"])
+
+        save_json(self.config.provenance_file, provenance)
+        return provenance
+
+    def _merge_partitions(self, partitions: list) -> dict:
+        """
+        Concatenate same-named CSVs across partitions into `unzip_dir`.
+
+        Non-CSV files are left in their partition directory.
+
+        Returns:
+            dict: {relative csv path: [{"name", "start_row", "end_row"}, ...]}
+        """
+        csv_files = []
+        for partition in partitions:
+            for member in partition["files"]:
+                if member.lower().endswith(".csv") and member not in csv_files:
+                    csv_files.append(member)
+
+        merged = {}
+        for member in csv_files:
+            paths = [(partition["name"], Path(partition["extract_dir"]) / member)
+                     for partition in partitions if member in partition["files"]]
+            target = Path(self.config.unzip_dir) / member
+            os.makedirs(target.parent, exist_ok=True)
 
+            if len(paths) == 1:
+                # Nothing to merge; copy the bytes instead of round-tripping through pandas
+                name, path = paths[0]
+                shutil.copyfile(path, target)
+                ranges = [{"name": name, "start_row": 0, "end_row": _csv_row_count(path)}]
+            else:
+                frames, ranges, offset = [], [], 0
+                for name, path in paths:
+                    frame = pd.read_csv(path)
+                    frames.append(frame)
+                    ranges.append({"name": name, "start_row": offset, "end_row": offset + len(frame)})
+                    offset += len(frame)
+                pd.concat(frames, ignore_index=True).to_csv(target, index=False)
 
+            merged[member] = ranges
+            logger.info("Merged %s from %d partition(s): %d rows", member, len(paths), ranges[-1]["end_row"])
+        return merged
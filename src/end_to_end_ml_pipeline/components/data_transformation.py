@@ -17,11 +17,11 @@ class DataTransformation:
 
         #Splitting the data into train test_split
 
-        train, test = train_test_split(data, test_size=0.2, random_state=42)
+        train, test = train_test_split(data, test_size=self.config.test_size, random_state=self.config.random_state)
 
         train.to_csv(os.path.join(self.config.root_dir, 'train.csv'), index=False)
         test.to_csv(os.path.join(self.config.root_dir, 'test.csv'), index=False)
 
         logger.info("Train-test split completed successfully")
-        logger.info(f"Train data shape: {train.shape}")
-        logger.info(f"Test data shape: {test.shape}")
+        logger.info("Train data shape: %s", train.shape)
+        logger.info("Test data shape: %s", test.shape)
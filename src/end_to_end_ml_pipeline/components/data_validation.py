@@ -2,8 +2,10 @@ import os
 import urllib.request as request
 from src.end_to_end_ml_pipeline import logger
 import zipfile
+import numpy as np
 import pandas as pd
 from src.end_to_end_ml_pipeline.entity.config_entity import (DataValidationConfig)
+from src.end_to_end_ml_pipeline.utils.common import save_json
 
 class DataValidation:
 
@@ -26,8 +28,8 @@ class DataValidation:
         try:
             data_file_path = self.config.unzip_data_dir
 
-            # Load the dataset
-            data = pd.read_csv(data_file_path)
+            # Only the header is needed here; rows are streamed later by filter_invalid_rows
+            data = pd.read_csv(data_file_path, nrows=0)
             all_colls = list(data.columns)  # Assuming 'data' is defined elsewhere with required columns
 
             all_schema = self.config.all_schema.keys()
@@ -48,7 +50,118 @@ class DataValidation:
         
         except Exception as e:
             raise e
-        
 
+    def _rule_failures(self, chunk: pd.DataFrame) -> dict:
+        """
+        Evaluate every row-level rule on one chunk as a NumPy boolean mask.
+
+        Rules come from two places in schema.yaml:
+            - COLUMNS: values in numeric (`int*`/`float*`) columns must parse as numbers,
+              and int columns must hold whole numbers. Other dtypes are not parsed.
+            - RULES: optional per-column `not_null`, `min`, `max` and `allowed` checks;
+              `min`/`max` only apply to numeric columns.
+
+        Returns:
+            dict: {"<column>:<rule>": mask}, where True marks a row that fails the rule.
+        """
+        failures = {}
+        for column, dtype in self.config.all_schema.items():
+            if column not in chunk.columns:
+                continue
+            raw = chunk[column]
+            missing = raw.isna().to_numpy()
+            rules = self.config.all_rules.get(column, {})
+            if rules.get("not_null", False):
+                failures[f"{column}:not_null"] = missing
+
+            if not str(dtype).startswith(("int", "float")):
+                if "allowed" in rules:
+                    failures[f"{column}:allowed"] = ~missing & ~raw.isin(list(rules["allowed"])).to_numpy()
+                continue
+
+            values = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=np.float64)
+            unparsed = np.isnan(values) & ~missing
+            if str(dtype).startswith("int"):
+                unparsed |= ~np.isnan(values) & (values != np.floor(values))
+            failures[f"{column}:dtype"] = unparsed
+
+            # NaN compares False, so missing values only fail not_null/dtype
+            if "min" in rules:
+                failures[f"{column}:min"] = values < rules["min"]
+            if "max" in rules:
+                failures[f"{column}:max"] = values > rules["max"]
+            if "allowed" in rules:
+                failures[f"{column}:allowed"] = ~np.isnan(values) & ~np.isin(values, list(rules["allowed"]))
+        return failures
+
+    def _restore_int_dtypes(self, clean: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast int schema columns back to their declared dtype.
+
+        pandas reads an int column as float64 in any chunk where it has a NaN, which would
+        write clean values as `5.0`. Rows left here passed the int `dtype` rule, so the
+        cast is exact; a column that still has NaNs (no `not_null` rule) uses pandas'
+        nullable `Int64` so the missing cells stay empty.
+        """
+        dtypes = {}
+        for column, dtype in self.config.all_schema.items():
+            if column in clean.columns and str(dtype).startswith("int") and clean[column].dtype != dtype:
+                dtypes[column] = "Int64" if clean[column].isna().any() else dtype
+        return clean.astype(dtypes) if dtypes else clean
+
+    def filter_invalid_rows(self) -> dict:
+        """
+        Split the dataset into clean rows and quarantined rows.
+
+        The file is streamed in chunks of `chunk_size` rows. Clean rows go to `clean_data_file`
+        for the next stage. Rows failing any rule go to `quarantine_file` with a `failed_rules`
+        column. Counts per rule are written to `report_file`.
+        The status file is set to False only if no clean rows are left.
+
+        Returns:
+            dict: The quality report.
+        """
+        try:
+            total_rows, clean_rows = 0, 0
+            rule_counts = {}
+            first_chunk = True
+
+            for chunk in pd.read_csv(self.config.unzip_data_dir, chunksize=self.config.chunk_size):
+                failures = self._rule_failures(chunk)
+                for rule, mask in failures.items():
+                    rule_counts[rule] = rule_counts.get(rule, 0) + int(mask.sum())
+
+                failed = np.vstack(list(failures.values())) if failures else np.zeros((0, len(chunk)), dtype=bool)
+                bad_rows = failed.any(axis=0)
+                rule_names = np.array(list(failures.keys()), dtype=object)
+
+                clean = self._restore_int_dtypes(chunk[~bad_rows])
+                quarantined = chunk[bad_rows].copy()
+                quarantined["failed_rules"] = [";".join(rule_names[failed[:, i]]) for i in np.flatnonzero(bad_rows)]
 
-      
\ No newline at end of file
+                mode = "w" if first_chunk else "a"
+                clean.to_csv(self.config.clean_data_file, mode=mode, header=first_chunk, index=False)
+                quarantined.to_csv(self.config.quarantine_file, mode=mode, header=first_chunk, index=False)
+                first_chunk = False
+
+                total_rows += len(chunk)
+                clean_rows += len(clean)
+
+            report = {
+                "total_rows": total_rows,
+                "clean_rows": clean_rows,
+                "quarantined_rows": total_rows - clean_rows,
+                "rule_failures": {rule: count for rule, count in rule_counts.items() if count},
+            }
+            save_json(self.config.report_file, report)
+            logger.info("Row validation: %d clean, %d quarantined of %d rows",
+                        clean_rows, total_rows - clean_rows, total_rows)
+
+            if clean_rows == 0:
+                with open(self.config.STATUS_FILE, 'w') as f:
+                    f.write(f"Validation Status: {False}\n")
+
+            return report
+
+        except Exception as e:
+            raise e
@@ -0,0 +1,165 @@
+import os
+import json
+import time
+import platform
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import numpy as np
+import pandas as pd
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.entity.config_entity import LoadTestConfig
+from src.end_to_end_ml_pipeline.utils.common import save_json
+from src.end_to_end_ml_pipeline.pipeline.prediction_pipeline import PredictionPipeline
+
+# Distinct request payloads generated per (backend, batch size); requests cycle through them
+PAYLOAD_POOL_SIZE = 64
+
+
+class LoadTest:
+    def __init__(self, config: LoadTestConfig):
+        """
+        Initialize LoadTest with configuration.
+
+        Args:
+            config: LoadTestConfig object containing the data path, mode and load grid.
+        """
+        self.config = config
+
+    def _load_rows(self) -> np.ndarray:
+        """
+        Load the feature rows that request batches are sampled from.
+        """
+        data = pd.read_csv(self.config.data_path)
+        return data.drop(columns=[self.config.target_column]).to_numpy(dtype=np.float64)
+
+    def _in_process_caller(self, backend: str):
+        """
+        Load a PredictionPipeline for `backend` and return (call, load_seconds).
+        """
+        start = time.perf_counter()
+        pipeline = PredictionPipeline(backend=backend)
+        load_seconds = time.perf_counter() - start
+        return pipeline.predict, load_seconds
+
+    def _http_caller(self):
+        """
+        Return a call that POSTs a prepared JSON body to the prediction server.
+
+        Each worker thread keeps its own HTTPConnection, which reconnects on its own
+        if the server closes it.
+        """
+        url = urlparse(self.config.url)
+        local = threading.local()
+
+        def call(body: bytes) -> bytes:
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = local.conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+            conn.request("POST", url.path or "/", body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            payload = response.read()
+            if response.status != 200:
+                raise RuntimeError(f"Prediction server returned {response.status}: {payload[:200]!r}")
+            return payload
+
+        return call
+
+    def _payloads(self, rows: np.ndarray, batch_size: int, backend: str) -> list:
+        """
+        Sample a fixed pool of request batches. For HTTP mode the JSON bodies are encoded
+        up front, so the client's serialization cost is kept out of the measurement.
+        """
+        rng = np.random.default_rng(42)
+        batches = [rows[rng.integers(0, len(rows), size=batch_size)] for _ in range(PAYLOAD_POOL_SIZE)]
+        if self.config.mode == "http":
+            return [json.dumps({"instances": batch.tolist(), "backend": backend}).encode() for batch in batches]
+        return batches
+
+    def _run(self, call, payloads: list, concurrency: int) -> dict:
+        """
+        Send `requests_per_run` requests from `concurrency` threads and summarise latency.
+
+        CPU time is `time.process_time` over the whole process, so in HTTP mode it only
+        covers the client side.
+        """
+        for i in range(self.config.warmup_requests):
+            call(payloads[i % len(payloads)])
+
+        n_requests = self.config.requests_per_run
+        shares = [n_requests // concurrency + (1 if i < n_requests % concurrency else 0) for i in range(concurrency)]
+
+        def worker(worker_id: int, share: int) -> list:
+            latencies = []
+            for i in range(share):
+                payload = payloads[(worker_id + i * concurrency) % len(payloads)]
+                start = time.perf_counter()
+                call(payload)
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            per_worker = list(executor.map(worker, range(concurrency), shares))
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+
+        latencies_ms = np.concatenate([np.asarray(latencies) for latencies in per_worker]) * 1000.0
+        return {
+            "requests": n_requests,
+            "wall_seconds": wall_seconds,
+            "throughput_rps": n_requests / wall_seconds,
+            "latency_ms": {
+                "p50": float(np.percentile(latencies_ms, 50)),
+                "p95": float(np.percentile(latencies_ms, 95)),
+                "p99": float(np.percentile(latencies_ms, 99)),
+                "mean": float(latencies_ms.mean()),
+                "max": float(latencies_ms.max()),
+            },
+            "cpu_ms_per_request": cpu_seconds * 1000.0 / n_requests,
+        }
+
+    def run(self) -> dict:
+        """
+        Benchmark every backend across the configured concurrency x batch-size grid.
+
+        Returns:
+            dict: The report written to `root_dir/report_name`.
+        """
+        rows = self._load_rows()
+        report = {
+            "mode": self.config.mode,
+            "url": self.config.url if self.config.mode == "http" else None,
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "requests_per_run": self.config.requests_per_run,
+            "load_seconds": {},
+            "results": [],
+        }
+
+        for backend in self.config.backends:
+            if self.config.mode == "http":
+                call = self._http_caller()
+            else:
+                call, report["load_seconds"][backend] = self._in_process_caller(backend)
+
+            for batch_size in self.config.batch_sizes:
+                payloads = self._payloads(rows, batch_size, backend)
+                for concurrency in self.config.concurrency:
+                    result = self._run(call, payloads, concurrency)
+                    result.update({
+                        "backend": backend,
+                        "batch_size": batch_size,
+                        "concurrency": concurrency,
+                        "rows_per_second": result["throughput_rps"] * batch_size,
+                    })
+                    report["results"].append(result)
+                    logger.info(
+                        "%s batch=%d concurrency=%d: p50=%.3fms p99=%.3fms %.0f req/s",
+                        backend, batch_size, concurrency, result["latency_ms"]["p50"],
+                        result["latency_ms"]["p99"], result["throughput_rps"],
+                    )
+
+        save_json(os.path.join(self.config.root_dir, self.config.report_name), report)
+        return report
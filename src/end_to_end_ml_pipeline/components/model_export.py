@@ -0,0 +1,52 @@
+import os
+import warnings
+import numpy as np
+import pandas as pd
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.entity.config_entity import ModelExportConfig
+from src.end_to_end_ml_pipeline.components.scoring_kernel import LinearScoringKernel
+from src.end_to_end_ml_pipeline.utils.common import load_bin
+
+
+class ModelExport:
+    def __init__(self, config: ModelExportConfig):
+        """
+        Initialize ModelExport with configuration.
+
+        Args:
+            config: ModelExportConfig object containing the model and kernel paths.
+        """
+        self.config = config
+
+    def export_scoring_kernel(self) -> LinearScoringKernel:
+        """
+        Compile the trained linear model into a NumPy-only scoring kernel and save it.
+
+        The kernel is checked against `model.predict` on the test split before it is
+        written, so a kernel on disk always reproduces sklearn's predictions exactly.
+
+        Returns:
+            LinearScoringKernel: The exported kernel.
+        """
+        model = load_bin(self.config.model_path)
+
+        test_data = pd.read_csv(self.config.test_data_path)
+        test_X = test_data.drop(columns=[self.config.target_column])
+
+        feature_names = getattr(model, "feature_names_in_", test_X.columns)
+        kernel = LinearScoringKernel.from_estimator(model, feature_names=list(feature_names))
+
+        X = test_X[kernel.feature_names].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            # Same ndarray goes to both scorers; silence sklearn's missing feature-names warning
+            warnings.simplefilter("ignore", category=UserWarning)
+            expected = model.predict(X)
+        actual = kernel.predict(X)
+        if not np.array_equal(expected, actual):
+            max_diff = float(np.max(np.abs(expected - actual)))
+            raise ValueError(f"Scoring kernel does not match model predictions (max abs diff {max_diff})")
+
+        kernel_path = os.path.join(self.config.root_dir, self.config.kernel_name)
+        kernel.save(kernel_path)
+        logger.info("Scoring kernel with %d features saved at %s", len(kernel.feature_names), kernel_path)
+        return kernel
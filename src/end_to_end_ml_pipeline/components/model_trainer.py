@@ -1,13 +1,45 @@
 import pandas as pd
+import numpy as np
 import os
+import shutil
+import hashlib
 from sklearn.linear_model import ElasticNet
+from sklearn.model_selection import KFold
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from src.end_to_end_ml_pipeline.entity.config_entity import ModelTrainerConfig
-from src.end_to_end_ml_pipeline.utils.common import save_bin, load_bin
+from src.end_to_end_ml_pipeline.utils.common import save_bin, load_bin, save_json, load_json, create_directories
 from src.end_to_end_ml_pipeline import logger
 import joblib
+from joblib import Parallel, delayed
 from pathlib import Path
 
 
+def eval_metrics(actual, pred) -> dict:
+    """
+    Compute the regression metrics reported for every fold and for the holdout split.
+    """
+    return {
+        "rmse": float(np.sqrt(mean_squared_error(actual, pred))),
+        "mae": float(mean_absolute_error(actual, pred)),
+        "r2": float(r2_score(actual, pred)),
+    }
+
+
+def _fit_fold(X, y, train_idx, test_idx, alpha, l1_ratio, random_state, fold_path) -> dict:
+    """
+    Fit and score one CV fold, caching the model and its scores at `fold_path`.
+
+    Runs inside a loky worker; X and y arrive as read-only memory maps, so only the
+    fold indices are actually sent to the worker.
+    """
+    model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=random_state)
+    model.fit(X[train_idx], y[train_idx])
+    scores = eval_metrics(y[test_idx], model.predict(X[test_idx]))
+    joblib.dump({"model": model, "scores": scores}, fold_path)
+    logger.info("Fold %s scored: %s", Path(fold_path).stem, scores, extra={"sample_every": 5})
+    return scores
+
+
 class ModelTrainer:
     def __init__(self, config: ModelTrainerConfig):
         """
@@ -18,22 +50,167 @@ class ModelTrainer:
         """
         self.config = config
 
+    def _data_key(self, X: np.ndarray, y: np.ndarray, feature_names: list) -> str:
+        """
+        Fingerprint the training data and fold settings. Fold indices are only reused
+        while this key is unchanged.
+        """
+        digest = hashlib.sha256()
+        digest.update(repr((feature_names, X.shape, self.config.cv_n_splits, self.config.cv_random_state)).encode())
+        digest.update(np.ascontiguousarray(X).tobytes())
+        digest.update(np.ascontiguousarray(y).tobytes())
+        return digest.hexdigest()
+
+    def _model_key(self) -> str:
+        """
+        Fingerprint the model hyperparameters. Cached fold models are grouped under it.
+        """
+        params = repr((self.config.alpha, self.config.l1_ratio, self.config.random_state))
+        return hashlib.sha256(params.encode()).hexdigest()[:16]
+
+    def _fold_ids(self, n_samples: int, data_key: str) -> np.ndarray:
+        """
+        Return a (n_repeats, n_samples) array giving the test fold of every row.
+
+        Repeat r is shuffled with seed `cv_random_state + r`, so it never depends on how
+        many repeats were requested. Stored repeats are reused and only missing ones
+        are computed and appended.
+        """
+        cv_dir = Path(self.config.cv_dir)
+        fold_ids_path = cv_dir / "fold_ids.npy"
+        meta_path = cv_dir / "folds_meta.json"
+
+        fold_ids = np.empty((0, n_samples), dtype=np.int32)
+        if fold_ids_path.exists() and meta_path.exists() and load_json(meta_path).data_key == data_key:
+            fold_ids = np.load(fold_ids_path)
+
+        if fold_ids.shape[0] < self.config.cv_n_repeats:
+            new_rows = []
+            for repeat in range(fold_ids.shape[0], self.config.cv_n_repeats):
+                kfold = KFold(n_splits=self.config.cv_n_splits, shuffle=True,
+                              random_state=self.config.cv_random_state + repeat)
+                row = np.empty(n_samples, dtype=np.int32)
+                for fold, (_, test_idx) in enumerate(kfold.split(np.zeros(n_samples))):
+                    row[test_idx] = fold
+                new_rows.append(row)
+            fold_ids = np.vstack([fold_ids] + new_rows)
+            np.save(fold_ids_path, fold_ids)
+            save_json(meta_path, {"data_key": data_key, "n_splits": self.config.cv_n_splits,
+                                  "random_state": self.config.cv_random_state})
+            logger.info("Fold indices for %d repeats saved at %s", fold_ids.shape[0], fold_ids_path)
+
+        return fold_ids[: self.config.cv_n_repeats]
+
+    def _prune_stale_caches(self, data_key: str) -> None:
+        """
+        Remove memory-mapped data copies and fold caches that belong to other training data.
+
+        Caches for other hyperparameters on the same data are kept, so switching params
+        back and forth stays cheap; a new data fingerprint starts from an empty cache.
+        """
+        cv_dir = Path(self.config.cv_dir)
+        for data_path in cv_dir.glob("data_*.joblib"):
+            if data_path.stem != f"data_{data_key}":
+                data_path.unlink()
+        folds_root = cv_dir / "folds"
+        if folds_root.exists():
+            for key_dir in folds_root.iterdir():
+                if key_dir.is_dir() and key_dir.name != data_key:
+                    shutil.rmtree(key_dir)
+                    logger.info("Removed stale CV cache %s", key_dir)
+
+    def cross_validate(self, train_X: pd.DataFrame, train_y: pd.Series) -> dict:
+        """
+        Run k-fold (or repeated k-fold) cross-validation on the training split.
+
+        Folds are fitted in parallel through joblib's loky backend against a memory-mapped
+        copy of the data. Every fitted fold is cached, so adding a repeat or re-running
+        with unchanged data and params only fits the folds that are missing.
+
+        Returns:
+            dict: Per-fold scores plus the mean and standard deviation of each metric.
+        """
+        cv_dir = Path(self.config.cv_dir)
+        create_directories([cv_dir])
+
+        X = train_X.to_numpy(dtype=np.float64)
+        y = train_y.to_numpy(dtype=np.float64)
+        data_key = self._data_key(X, y, list(train_X.columns))
+        fold_ids = self._fold_ids(len(y), data_key)
+
+        # Fold caches are only valid for this exact data; drop caches left by older data
+        self._prune_stale_caches(data_key[:16])
+        folds_dir = cv_dir / "folds" / data_key[:16] / self._model_key()
+        create_directories([folds_dir], verbose=False)
+
+        data_path = cv_dir / f"data_{data_key[:16]}.joblib"
+        if not data_path.exists():
+            joblib.dump((X, y), data_path)
+        X_mmap, y_mmap = joblib.load(data_path, mmap_mode="r")
+
+        results, pending = {}, []
+        for repeat in range(fold_ids.shape[0]):
+            for fold in range(self.config.cv_n_splits):
+                name = f"repeat_{repeat}_fold_{fold}"
+                fold_path = folds_dir / f"{name}.joblib"
+                if fold_path.exists():
+                    results[name] = joblib.load(fold_path)["scores"]
+                else:
+                    test_mask = fold_ids[repeat] == fold
+                    pending.append((name, np.flatnonzero(~test_mask), np.flatnonzero(test_mask), fold_path))
+
+        logger.info("Cross-validation: %d folds cached, %d to fit", len(results), len(pending))
+        if pending:
+            fitted = Parallel(n_jobs=self.config.cv_n_jobs, backend="loky")(
+                delayed(_fit_fold)(X_mmap, y_mmap, train_idx, test_idx, self.config.alpha,
+                                   self.config.l1_ratio, self.config.random_state, fold_path)
+                for _, train_idx, test_idx, fold_path in pending
+            )
+            results.update({name: scores for (name, *_), scores in zip(pending, fitted)})
+
+        ordered = dict(sorted(results.items(), key=lambda item: tuple(int(part) for part in item[0].split("_")[1::2])))
+        summary = {
+            metric: {
+                "mean": float(np.mean([scores[metric] for scores in ordered.values()])),
+                "std": float(np.std([scores[metric] for scores in ordered.values()])),
+            }
+            for metric in next(iter(ordered.values()))
+        }
+        return {
+            "n_splits": self.config.cv_n_splits,
+            "n_repeats": self.config.cv_n_repeats,
+            "summary": summary,
+            "folds": ordered,
+        }
+
     def train_model(self):
         """
         Train the ElasticNet model using the training data and save the trained model.
+
+        When cross-validation is enabled the model is first scored with k-fold CV on the
+        training split. The final model is always fitted on the full training split and
+        scored on the held-out test split.
         """
         logger.info("Loading training data from: %s", self.config.train_data_path)
         train_data = pd.read_csv(self.config.train_data_path)
         test_data = pd.read_csv(self.config.test_data_path)
 
-        train_X = train_data.drop(columns=[self.config.target_column], axis=1)
-        test_X = test_data.drop(columns=[self.config.target_column], axis=1)
+        train_X = train_data.drop(columns=[self.config.target_column])
+        test_X = test_data.drop(columns=[self.config.target_column])
         train_y = train_data[self.config.target_column]
         test_y = test_data[self.config.target_column]
 
-        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
+        metrics = {}
+        if self.config.cv_enabled:
+            metrics["cross_validation"] = self.cross_validate(train_X, train_y)
+            logger.info("Cross-validation summary: %s", metrics["cross_validation"]["summary"])
+
+        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=self.config.random_state)
         lr.fit(train_X, train_y)
 
+        metrics["test"] = eval_metrics(test_y, lr.predict(test_X))
+        logger.info("Holdout test metrics: %s", metrics["test"])
+        save_json(os.path.join(self.config.root_dir, self.config.metrics_name), metrics)
+
         joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
         logger.info("Model trained and saved at %s", os.path.join(self.config.root_dir, self.config.model_name))
-
@@ -0,0 +1,239 @@
+import os
+import re
+import sys
+import json
+import shutil
+import fnmatch
+import hashlib
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.entity.config_entity import RunSnapshotConfig
+from src.end_to_end_ml_pipeline.utils.common import save_json
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """
+    SHA-256 of a file, read in fixed-size chunks so large artifacts never sit in memory.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _flatten(data, prefix: str = "") -> dict:
+    """
+    Flatten nested dicts into {"a.b.c": value} so configs can be compared key by key.
+    """
+    if not isinstance(data, dict):
+        return {prefix: data}
+    flat = {}
+    for key, value in data.items():
+        flat.update(_flatten(value, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def _diff_dicts(old: dict, new: dict) -> dict:
+    """
+    Compare two flat dicts.
+
+    Returns:
+        dict: {"added": {...}, "removed": {...}, "changed": {key: [old, new]}}
+    """
+    return {
+        "added": {key: new[key] for key in sorted(new.keys() - old.keys())},
+        "removed": {key: old[key] for key in sorted(old.keys() - new.keys())},
+        "changed": {key: [old[key], new[key]] for key in sorted(old.keys() & new.keys()) if old[key] != new[key]},
+    }
+
+
+def _artifact_hashes(manifest: dict) -> dict:
+    return {path: entry["sha256"] for path, entry in manifest["artifacts"].items()}
+
+
+class RunSnapshot:
+    def __init__(self, config: RunSnapshotConfig):
+        """
+        Initialize RunSnapshot with configuration.
+
+        Args:
+            config: RunSnapshotConfig object containing the run, store and artifact paths.
+        """
+        self.config = config
+
+    def _hash_artifacts(self) -> dict:
+        """
+        Hash every file under `artifacts_root`, except those matching `exclude_globs`.
+
+        A file whose size and mtime match the hash cache is not read again, so
+        unchanged CSVs cost one `stat` per run.
+
+        Returns:
+            dict: {relative path: {"sha256": ..., "size": ...}}
+        """
+        cache_path = Path(self.config.root_dir) / "hash_cache.json"
+        cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+
+        artifacts_root = Path(self.config.artifacts_root)
+        artifacts, new_cache = {}, {}
+        for path in sorted(p for p in artifacts_root.rglob("*") if p.is_file()):
+            rel_path = path.relative_to(artifacts_root).as_posix()
+            if any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.config.exclude_globs):
+                continue
+            stat = path.stat()
+            key = str(path.resolve())
+            cached = cache.get(key)
+            if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+                sha256 = cached["sha256"]
+            else:
+                sha256 = hash_file(path)
+            new_cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+            artifacts[rel_path] = {"sha256": sha256, "size": stat.st_size}
+
+        cache_path.write_text(json.dumps(new_cache))
+        return artifacts
+
+    def _store_artifacts(self, artifacts: dict) -> int:
+        """
+        Copy artifacts into the content-addressed store (`store_dir/ab/cdef...`).
+
+        Content already in the store is skipped, so unchanged files are stored once no
+        matter how many runs reference them. Files are copied rather than hard-linked
+        because stages rewrite artifacts in place.
+
+        Returns:
+            int: Number of new objects written.
+        """
+        store_dir = Path(self.config.store_dir)
+        written = 0
+        for rel_path, entry in artifacts.items():
+            object_path = store_dir / entry["sha256"][:2] / entry["sha256"][2:]
+            if object_path.exists():
+                continue
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            # Copy to a temp file first so an interrupted run never leaves a partial object
+            fd, tmp_path = tempfile.mkstemp(dir=object_path.parent)
+            os.close(fd)
+            shutil.copyfile(Path(self.config.artifacts_root) / rel_path, tmp_path)
+            os.replace(tmp_path, object_path)
+            written += 1
+        return written
+
+    def _code_version(self) -> dict:
+        """
+        Identify the code that produced the run: git commit (if available) plus a hash
+        of the tracked source files, which also covers uncommitted edits.
+        """
+        digest = hashlib.sha256()
+        for pattern in self.config.source_globs:
+            for path in sorted(Path(".").glob(pattern)):
+                if path.is_file():
+                    digest.update(path.as_posix().encode())
+                    digest.update(hash_file(path).encode())
+
+        code = {"source_sha256": digest.hexdigest(), "git_commit": None, "git_dirty": None}
+        try:
+            code["git_commit"] = subprocess.run(
+                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+            ).stdout.strip()
+            code["git_dirty"] = bool(subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+            ).stdout.strip())
+        except (OSError, subprocess.CalledProcessError):
+            logger.info("git not available; recording source hash only")
+        return code
+
+    def _library_versions(self) -> dict:
+        """
+        Installed versions of the packages listed in requirements.txt.
+        """
+        versions = {"python": sys.version.split()[0]}
+        with open(self.config.requirements_file) as f:
+            for line in f:
+                name = re.split(r"[<>=!~;\[\s]", line.strip(), maxsplit=1)[0]
+                if not name or name.startswith("#") or name.startswith("-"):
+                    continue
+                try:
+                    versions[name] = metadata.version(name)
+                except metadata.PackageNotFoundError:
+                    versions[name] = None
+        return versions
+
+    def snapshot(self) -> Path:
+        """
+        Write a manifest for the current state of `artifacts_root` and store its files.
+
+        The manifest holds artifact hashes and sizes, the resolved config/params/schema,
+        the seeds, library versions and code version.
+
+        Returns:
+            Path: The manifest path, `root_dir/manifests/<run_id>.json`.
+        """
+        Path(self.config.root_dir).mkdir(parents=True, exist_ok=True)
+        Path(self.config.store_dir).mkdir(parents=True, exist_ok=True)
+
+        artifacts = self._hash_artifacts()
+        written = self._store_artifacts(artifacts)
+
+        artifacts_digest = hashlib.sha256(json.dumps(artifacts, sort_keys=True).encode()).hexdigest()
+        run_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%fZ}-{artifacts_digest[:8]}"
+        manifest = {
+            "run_id": run_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "code": self._code_version(),
+            "libraries": self._library_versions(),
+            "seeds": self.config.seeds,
+            "config": self.config.resolved_config,
+            "artifacts": artifacts,
+        }
+
+        manifests_dir = Path(self.config.root_dir) / "manifests"
+        manifests_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = manifests_dir / f"{run_id}.json"
+        save_json(manifest_path, manifest)
+        logger.info("Run %s: %d artifacts, %d new objects stored", run_id, len(artifacts), written)
+        return manifest_path
+
+    def resolve_manifest(self, ref: str) -> Path:
+        """
+        Turn a manifest path, run id, `latest` or `previous` into a manifest path.
+        """
+        manifests = sorted((Path(self.config.root_dir) / "manifests").glob("*.json"))
+        if ref in {"latest", "previous"}:
+            index = -1 if ref == "latest" else -2
+            if len(manifests) < -index:
+                raise FileNotFoundError(f"Not enough recorded runs to resolve '{ref}'")
+            return manifests[index]
+        if Path(ref).is_file():
+            return Path(ref)
+        matches = [path for path in manifests if path.stem.startswith(ref)]
+        if len(matches) != 1:
+            raise FileNotFoundError(f"Run '{ref}' matches {len(matches)} manifests")
+        return matches[0]
+
+    def diff(self, old_ref: str = "previous", new_ref: str = "latest") -> dict:
+        """
+        Compare two run manifests. Only the manifests are read, never the artifacts.
+
+        Returns:
+            dict: Differences per section (artifacts, config, seeds, libraries, code).
+        """
+        old = json.loads(self.resolve_manifest(old_ref).read_text())
+        new = json.loads(self.resolve_manifest(new_ref).read_text())
+
+        return {
+            "old": old["run_id"],
+            "new": new["run_id"],
+            "artifacts": _diff_dicts(_artifact_hashes(old), _artifact_hashes(new)),
+            "config": _diff_dicts(_flatten(old["config"]), _flatten(new["config"])),
+            "seeds": _diff_dicts(_flatten(old["seeds"]), _flatten(new["seeds"])),
+            "libraries": _diff_dicts(old["libraries"], new["libraries"]),
+            "code": _diff_dicts(old["code"], new["code"]),
+        }
@@ -0,0 +1,91 @@
+import numpy as np
+from pathlib import Path
+from typing import Mapping, Sequence, Union
+
+
+class LinearScoringKernel:
+    """
+    Dependency-free scorer for a fitted linear model (y = X @ coef + intercept).
+
+    Only NumPy is needed at predict time, so serving does not pay for importing
+    sklearn/joblib or for the input validation done inside `estimator.predict`.
+    The arithmetic is the same dense matmul sklearn performs, so the results
+    match `ElasticNet.predict` exactly for float64 inputs.
+    """
+
+    def __init__(self, coef: np.ndarray, intercept: float, feature_names: Sequence[str]):
+        """
+        Initialize the kernel from raw model parameters.
+
+        Args:
+            coef: 1-D array of model coefficients, in `feature_names` order.
+            intercept: Model intercept.
+            feature_names: Column names the coefficients were fitted on.
+        """
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = np.float64(intercept)
+        self.feature_names = [str(name) for name in feature_names]
+
+        if self.coef.ndim != 1 or self.coef.shape[0] != len(self.feature_names):
+            raise ValueError(
+                f"coef shape {self.coef.shape} does not match {len(self.feature_names)} feature names"
+            )
+
+    @classmethod
+    def from_estimator(cls, estimator, feature_names: Sequence[str]) -> "LinearScoringKernel":
+        """
+        Build a kernel from a fitted sklearn linear estimator (e.g. ElasticNet).
+        """
+        return cls(coef=estimator.coef_, intercept=estimator.intercept_, feature_names=feature_names)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write coefficients, intercept and feature order to an uncompressed .npz file.
+
+        Feature names are stored as a fixed-width unicode array so loading never
+        needs `allow_pickle`.
+        """
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                coef=self.coef,
+                intercept=np.array(self.intercept, dtype=np.float64),
+                feature_names=np.array(self.feature_names, dtype=np.str_),
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LinearScoringKernel":
+        """
+        Load a kernel previously written with `save`.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                coef=data["coef"],
+                intercept=float(data["intercept"]),
+                feature_names=data["feature_names"].tolist(),
+            )
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Score a 2-D array of rows (or a single 1-D row) already in feature order.
+
+        No column checks are done here; this is the hot path.
+
+        Returns:
+            np.ndarray: 1-D array of predictions, one per row.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        return X @ self.coef + self.intercept
+
+    def predict_records(self, records: Sequence[Mapping[str, float]]) -> np.ndarray:
+        """
+        Score rows given as {feature_name: value} mappings, reordering to the fitted
+        feature order.
+        """
+        X = np.array(
+            [[record[name] for name in self.feature_names] for record in records],
+            dtype=np.float64,
+        )
+        return self.predict(X)
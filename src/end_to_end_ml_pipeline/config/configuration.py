@@ -12,7 +12,9 @@ from src.end_to_end_ml_pipeline.utils.common import read_yaml, create_directorie
 # Import the dataclass (or pydantic model) that represents the config
 # for the "data ingestion" stage of the pipeline.
 from src.end_to_end_ml_pipeline.entity.config_entity import (DataIngestionConfig, DataValidationConfig
-                                                             , DataTransformationConfig, ModelTrainerConfig)
+                                                             , DataTransformationConfig, ModelTrainerConfig
+                                                             , ModelExportConfig, PredictionConfig
+                                                             , LoadTestConfig, RunSnapshotConfig)
 
 class ConfigurationManager:
     """
@@ -78,9 +80,12 @@ class ConfigurationManager:
         # Example (from YAML):
         # data_ingestion:
         #   root_dir: artifacts/data_ingestion
-        #   source_URL: "https://example.com/data.zip"
+        #   source_URL: "https://example.com/data.zip"   # or a list of URLs / local paths / globs
         #   local_data_file: artifacts/data_ingestion/data.zip
         #   unzip_dir: artifacts/data_ingestion/extracted
+        #   partitions_dir: artifacts/data_ingestion/partitions
+        #   provenance_file: artifacts/data_ingestion/provenance.json
+        #   max_workers: 4
         #
         # After read_yaml(), you can access this with dot notation.
         config = self.config.data_ingestion
@@ -93,16 +98,19 @@ class ConfigurationManager:
         # This gives us safer path handling and nicer APIs (like .exists(), .mkdir(), etc.).
         data_ingestion_config = DataIngestionConfig(
             root_dir=Path(config.root_dir),
-            source_URL=config.source_URL,
+            source_URL=config.source_URL if isinstance(config.source_URL, str) else list(config.source_URL),
             local_data_file=Path(config.local_data_file),
             unzip_dir=Path(config.unzip_dir),
+            partitions_dir=Path(config.partitions_dir),
+            provenance_file=Path(config.provenance_file),
+            max_workers=config.max_workers,
         )
 
         # Return that object so the data ingestion pipeline step can use it.
         # Example usage downstream:
         #   cfg = config_manager.get_data_ingestion_config()
         #   downloader = DataIngestion(cfg)
-        #   downloader.download_zip()
+        #   downloader.ingest_sources()
         return data_ingestion_config
     
 
@@ -117,6 +125,7 @@ class ConfigurationManager:
                 - self.config.data_validation.unzip_dir: str | Path
             - (implicit) self.schema: a schema object loaded from YAML, expected to contain:
                 - self.schema.COLUMNS: dict-like schema of expected columns/dtypes
+                - self.schema.RULES: optional dict-like row-level rules per column
 
         Process:
             - Reads the `data_validation` section from the main config.
@@ -130,6 +139,9 @@ class ConfigurationManager:
                 - STATUS_FILE: Path
                 - unzip_data_dir: Path
                 - all_schema: dict (columns spec)
+                - all_rules: dict (row-level rules spec)
+                - clean_data_file / quarantine_file / report_file: Path
+                - chunk_size: int
 
         Side effects:
             - Creates the directory at `root_dir` if it does not already exist.
@@ -141,6 +153,7 @@ class ConfigurationManager:
         # Pull the `data_validation` section and the column schema
         config = self.config.data_validation
         schema = self.schema.COLUMNS
+        rules = self.schema.get("RULES", {})
 
         # Normalize to Path for safer downstream usage
         root_dir = Path(config.root_dir)
@@ -156,6 +169,11 @@ class ConfigurationManager:
             STATUS_FILE=status_file,
             unzip_data_dir=unzip_data_dir,
             all_schema=schema,
+            all_rules=rules,
+            clean_data_file=Path(config.clean_data_file),
+            quarantine_file=Path(config.quarantine_file),
+            report_file=Path(config.report_file),
+            chunk_size=config.chunk_size,
         )
         return data_validation_config
     
@@ -178,6 +196,7 @@ class ConfigurationManager:
             A configuration record with:
                 - root_dir: Path
                 - transformed_data_dir: Path
+                - test_size / random_state: from params.yaml TrainTestSplit
         Side effects:
             - Creates the directory at `root_dir` if it does not already exist.
         Raises:
@@ -185,11 +204,14 @@ class ConfigurationManager:
             if the config are missing required fields.
         """
         config = self.config.data_transformation
+        params = self.params.TrainTestSplit
 
         create_directories([config.root_dir])
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
             data_path= config.data_path,
+            test_size=params.test_size,
+            random_state=params.random_state,
         )
         return data_transformation_config
     
@@ -201,6 +223,7 @@ class ConfigurationManager:
         """
         config = self.config.model_trainer
         params=self.params.ElasticNet
+        cv_params=self.params.CrossValidation
         schema=self.schema.TARGET_COLUMN
 
         create_directories([config.root_dir])
@@ -213,5 +236,117 @@ class ConfigurationManager:
             alpha=params.alpha,
             l1_ratio=params.l1_ratio,
             target_column=schema.name,
+            metrics_name=config.metrics_name,
+            cv_dir=config.cv_dir,
+            cv_enabled=cv_params.enabled,
+            cv_n_splits=cv_params.n_splits,
+            cv_n_repeats=cv_params.n_repeats,
+            cv_n_jobs=cv_params.n_jobs,
+            cv_random_state=cv_params.random_state,
+            random_state=params.random_state,
         )
         return model_trainer_config
+
+
+    def get_model_export_config(self) -> ModelExportConfig:
+
+        """
+        Build and return the ModelExportConfig for the scoring-kernel export stage.
+        """
+        config = self.config.model_export
+        schema = self.schema.TARGET_COLUMN
+
+        create_directories([config.root_dir])
+
+        model_export_config = ModelExportConfig(
+            root_dir=config.root_dir,
+            model_path=config.model_path,
+            test_data_path=config.test_data_path,
+            kernel_name=config.kernel_name,
+            target_column=schema.name,
+        )
+        return model_export_config
+
+
+    def get_prediction_config(self) -> PredictionConfig:
+
+        """
+        Build and return the PredictionConfig used to load a model for serving.
+        """
+        config = self.config.prediction
+
+        prediction_config = PredictionConfig(
+            model_path=Path(config.model_path),
+            kernel_path=Path(config.kernel_path),
+            backend=config.backend,
+        )
+        return prediction_config
+
+
+    def get_load_test_config(self) -> LoadTestConfig:
+
+        """
+        Build and return the LoadTestConfig for benchmarking the prediction path.
+        """
+        config = self.config.load_test
+        schema = self.schema.TARGET_COLUMN
+
+        create_directories([config.root_dir])
+
+        load_test_config = LoadTestConfig(
+            root_dir=config.root_dir,
+            data_path=config.data_path,
+            report_name=config.report_name,
+            target_column=schema.name,
+            mode=config.mode,
+            url=config.url,
+            backends=list(config.backends),
+            concurrency=list(config.concurrency),
+            batch_sizes=list(config.batch_sizes),
+            requests_per_run=config.requests_per_run,
+            warmup_requests=config.warmup_requests,
+        )
+        return load_test_config
+
+
+    def get_run_snapshot_config(self) -> RunSnapshotConfig:
+
+        """
+        Build and return the RunSnapshotConfig for recording a pipeline run.
+
+        The resolved config/params/schema and every `random_state`/`seed` found in
+        params.yaml are captured here so the manifest records exactly what the
+        stages were given.
+
+        No directories are created here: `diff` only reads manifests, and
+        `RunSnapshot.snapshot` creates what it writes to.
+        """
+        config = self.config.run_snapshot
+
+        params = self.params.to_dict()
+        seeds = {}
+
+        def collect_seeds(section: dict, prefix: str = "") -> None:
+            for key, value in section.items():
+                if isinstance(value, dict):
+                    collect_seeds(value, f"{prefix}{key}.")
+                elif key in {"random_state", "seed"}:
+                    seeds[f"{prefix}{key}"] = value
+
+        collect_seeds(params)
+
+        run_snapshot_config = RunSnapshotConfig(
+            root_dir=Path(config.root_dir),
+            store_dir=Path(config.store_dir),
+            artifacts_root=Path(self.config.artifacts_root),
+            requirements_file=Path(config.requirements_file),
+            source_globs=list(config.source_globs),
+            exclude_globs=list(config.exclude_globs),
+            resolved_config={
+                "config": self.config.to_dict(),
+                "params": params,
+                "schema": self.schema.to_dict(),
+            },
+            seeds=seeds,
+        )
+        return run_snapshot_config
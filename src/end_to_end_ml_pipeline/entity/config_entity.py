@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import List, Union
 
 @dataclass
 class DataIngestionConfig:
     root_dir: Path
-    source_URL: str
+    source_URL: Union[str, List[str]]
     local_data_file: Path
     unzip_dir: Path
+    partitions_dir: Path
+    provenance_file: Path
+    max_workers: int
 
 @dataclass
 class DataValidationConfig:
@@ -14,11 +18,18 @@ class DataValidationConfig:
     STATUS_FILE: str
     unzip_data_dir: Path
     all_schema: dict
+    all_rules: dict
+    clean_data_file: Path
+    quarantine_file: Path
+    report_file: Path
+    chunk_size: int
 
 @dataclass
 class DataTransformationConfig:
     root_dir: Path
     data_path: Path
+    test_size: float
+    random_state: int
 
 @dataclass
 class ModelTrainerConfig:
@@ -29,3 +40,50 @@ class ModelTrainerConfig:
     alpha: float
     l1_ratio: float
     target_column: str
+    metrics_name: str
+    cv_dir: Path
+    cv_enabled: bool
+    cv_n_splits: int
+    cv_n_repeats: int
+    cv_n_jobs: int
+    cv_random_state: int
+    random_state: int
+
+@dataclass
+class ModelExportConfig:
+    root_dir: Path
+    model_path: Path
+    test_data_path: Path
+    kernel_name: str
+    target_column: str
+
+@dataclass
+class PredictionConfig:
+    model_path: Path
+    kernel_path: Path
+    backend: str
+
+@dataclass
+class LoadTestConfig:
+    root_dir: Path
+    data_path: Path
+    report_name: str
+    target_column: str
+    mode: str
+    url: str
+    backends: List[str]
+    concurrency: List[int]
+    batch_sizes: List[int]
+    requests_per_run: int
+    warmup_requests: int
+
+@dataclass
+class RunSnapshotConfig:
+    root_dir: Path
+    store_dir: Path
+    artifacts_root: Path
+    requirements_file: Path
+    source_globs: List[str]
+    exclude_globs: List[str]
+    resolved_config: dict
+    seeds: dict
@@ -12,8 +12,7 @@ class DataIngestionPipeline:
         self.config = ConfigurationManager()
         data_ingestion_config = self.config.get_data_ingestion_config()
         data_ingestion = DataIngestion(data_ingestion_config)
-        data_ingestion.download_file()
-        data_ingestion.extract_zip_file()
+        data_ingestion.ingest_sources()
 
 
     
\ No newline at end of file
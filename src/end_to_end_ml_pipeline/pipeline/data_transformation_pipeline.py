@@ -38,5 +38,5 @@ class TransformationPipeline():
                 raise Exception("Data Validation not completed. Cannot proceed to Data Transformation.")
             
         except Exception as e:
-            logger.error(f"Error in {STAGE_NAME}: {e}")
+            logger.error("Error in %s: %s", STAGE_NAME, e)
             raise e 
\ No newline at end of file
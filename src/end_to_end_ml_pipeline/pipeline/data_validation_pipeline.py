@@ -12,7 +12,8 @@ class DataValidationPipeline:
         self.config = ConfigurationManager()
         data_validation_config = self.config.get_data_validation_config()
         data_validation = DataValidation(data_validation_config)
-        data_validation.validate_all_columns()
+        if data_validation.validate_all_columns():
+            data_validation.filter_invalid_rows()
 
 if __name__ == "__main__":
     try:
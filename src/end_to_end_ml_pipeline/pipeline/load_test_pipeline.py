@@ -0,0 +1,41 @@
+import argparse
+from dataclasses import replace
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.components.load_test import LoadTest
+from src.end_to_end_ml_pipeline.config.configuration import ConfigurationManager
+
+STAGE_NAME = "Load Test Stage"
+
+class LoadTestPipeline:
+    def __init__(self):
+        pass
+
+    def initiate_load_test(self, **overrides):
+        """
+        Run the load test. Keyword arguments override fields of LoadTestConfig.
+        """
+        self.config = ConfigurationManager()
+        load_test_config = replace(self.config.get_load_test_config(), **overrides)
+        load_test = LoadTest(load_test_config)
+        load_test.run()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark latency and throughput of the prediction path.")
+    parser.add_argument("--mode", choices=["in_process", "http"])
+    parser.add_argument("--url", help="Prediction endpoint for http mode, e.g. http://127.0.0.1:8080/predict")
+    parser.add_argument("--backends", nargs="+", choices=["sklearn", "kernel"])
+    parser.add_argument("--concurrency", nargs="+", type=int)
+    parser.add_argument("--batch-sizes", dest="batch_sizes", nargs="+", type=int)
+    parser.add_argument("--requests", dest="requests_per_run", type=int)
+    args = parser.parse_args()
+
+    try:
+        logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+        load_test_pipeline = LoadTestPipeline()
+        load_test_pipeline.initiate_load_test(**{k: v for k, v in vars(args).items() if v is not None})
+
+        logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -0,0 +1,27 @@
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.components.model_export import ModelExport
+from src.end_to_end_ml_pipeline.config.configuration import ConfigurationManager
+
+STAGE_NAME = "Model Export Stage"
+
+class ModelExportPipeline:
+    def __init__(self):
+        pass
+
+    def initiate_model_export(self):
+        self.config = ConfigurationManager()
+        model_export_config = self.config.get_model_export_config()
+        model_export = ModelExport(model_export_config)
+        model_export.export_scoring_kernel()
+
+
+if __name__ == "__main__":
+    try:
+        logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+        model_export_pipeline = ModelExportPipeline()
+        model_export_pipeline.initiate_model_export()
+
+        logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
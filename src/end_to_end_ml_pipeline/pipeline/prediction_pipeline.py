@@ -0,0 +1,52 @@
+import numpy as np
+from src.end_to_end_ml_pipeline.config.configuration import ConfigurationManager
+from src.end_to_end_ml_pipeline.components.scoring_kernel import LinearScoringKernel
+from src.end_to_end_ml_pipeline.utils.common import load_bin
+from src.end_to_end_ml_pipeline import logger
+
+BACKENDS = ("sklearn", "kernel")
+
+class PredictionPipeline:
+    def __init__(self, backend: str = None):
+        """
+        Load the trained model for serving.
+
+        Args:
+            backend: "sklearn" loads model.joblib and calls `predict`; "kernel" loads the
+                exported NumPy scoring kernel and never imports sklearn. Defaults to
+                `prediction.backend` in config.yaml.
+        """
+        config = ConfigurationManager().get_prediction_config()
+        self.backend = backend or config.backend
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown prediction backend '{self.backend}', expected one of {BACKENDS}")
+
+        if self.backend == "kernel":
+            self.model = LinearScoringKernel.load(config.kernel_path)
+            self.feature_names = self.model.feature_names
+        else:
+            # Unpickling is what pulls in sklearn; the kernel backend never does
+            self.model = load_bin(config.model_path)
+            self.feature_names = list(self.model.feature_names_in_)
+            # predict gets a plain ndarray in feature order (column count is checked in
+            # `predict`); dropping the names from this loaded copy keeps sklearn from
+            # warning on every call without touching the process-wide warning filters
+            del self.model.feature_names_in_
+        logger.info("Prediction pipeline ready with %s backend", self.backend)
+
+    def predict(self, data) -> np.ndarray:
+        """
+        Score rows given in feature order (2-D array-like, or a single 1-D row).
+
+        Returns:
+            np.ndarray: One prediction per row.
+        """
+        if self.backend == "kernel":
+            return self.model.predict(data)
+
+        X = np.asarray(data, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected rows with {len(self.feature_names)} features, got shape {X.shape}")
+        return self.model.predict(X)
@@ -0,0 +1,48 @@
+import json
+import argparse
+from src.end_to_end_ml_pipeline import logger
+from src.end_to_end_ml_pipeline.components.run_snapshot import RunSnapshot
+from src.end_to_end_ml_pipeline.config.configuration import ConfigurationManager
+from src.end_to_end_ml_pipeline.utils.logging_setup import send_console_to_stderr
+
+STAGE_NAME = "Run Snapshot Stage"
+
+class RunSnapshotPipeline:
+    def __init__(self):
+        pass
+
+    def initiate_run_snapshot(self):
+        self.config = ConfigurationManager()
+        run_snapshot_config = self.config.get_run_snapshot_config()
+        run_snapshot = RunSnapshot(run_snapshot_config)
+        return run_snapshot.snapshot()
+
+    def initiate_diff(self, old_ref: str = "previous", new_ref: str = "latest") -> dict:
+        self.config = ConfigurationManager()
+        run_snapshot_config = self.config.get_run_snapshot_config()
+        run_snapshot = RunSnapshot(run_snapshot_config)
+        return run_snapshot.diff(old_ref, new_ref)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record or compare pipeline run manifests.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("snapshot", help="Write a manifest for the current artifacts.")
+    diff_parser = subparsers.add_parser("diff", help="Compare two manifests without reading the data.")
+    diff_parser.add_argument("old", nargs="?", default="previous", help="Run id, manifest path, 'previous' or 'latest'")
+    diff_parser.add_argument("new", nargs="?", default="latest", help="Run id, manifest path, 'previous' or 'latest'")
+    args = parser.parse_args()
+
+    try:
+        run_snapshot_pipeline = RunSnapshotPipeline()
+        if args.command == "diff":
+            # stdout carries the diff JSON; keep log lines on stderr so it stays parseable
+            send_console_to_stderr()
+            print(json.dumps(run_snapshot_pipeline.initiate_diff(args.old, args.new), indent=4, default=str))
+        else:
+            logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+            run_snapshot_pipeline.initiate_run_snapshot()
+            logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        logger.exception(e)
+        raise e
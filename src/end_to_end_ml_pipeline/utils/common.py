@@ -31,14 +31,14 @@ def read_yaml(path_to_yaml: Union[str, Path]) -> ConfigBox:
     try:
         with open(path_to_yaml, "r") as yaml_file:
             content = yaml.safe_load(yaml_file)
-        logger.info(f"YAML file loaded successfully: {path_to_yaml}")
+        logger.info("YAML file loaded successfully: %s", path_to_yaml)
         return ConfigBox(content)
     except BoxValueError:
         # BoxValueError usually means yaml.safe_load() returned None or invalid structure
-        logger.error(f"YAML file is empty or invalid: {path_to_yaml}")
+        logger.error("YAML file is empty or invalid: %s", path_to_yaml)
         raise ValueError(f"YAML file is empty or invalid: {path_to_yaml}")
     except Exception as e:
-        logger.error(f"Error reading the YAML file {path_to_yaml}: {e}")
+        logger.error("Error reading the YAML file %s: %s", path_to_yaml, e)
         raise e
 
 
@@ -53,7 +53,7 @@ def create_directories(path_to_directories: list, verbose= True):
     for path in path_to_directories:
         os.makedirs(path, exist_ok=True)
         if verbose: 
-            logger.info(f"Directory created/verified at: {path}")
+            logger.info("Directory created/verified at: %s", path)
     
 
 
@@ -69,7 +69,7 @@ def save_json(path: str, data: dict) -> None:
     """
     with open(path, "w") as json_file:
         json.dump(data, json_file, indent=4)
-    logger.info(f"JSON file saved at: {path}")
+    logger.info("JSON file saved at: %s", path)
 
 
 
@@ -84,7 +84,7 @@ def load_json(path: str) -> ConfigBox:
     """
     with open(path, "r") as json_file:
         data = json.load(json_file)
-    logger.info(f"JSON file loaded from: {path}")
+    logger.info("JSON file loaded from: %s", path)
     return ConfigBox(data)
 
 
@@ -100,7 +100,7 @@ def save_bin(data: object, path: Union[Path, str]) -> None:
         path (Path): Where to store the binary file, e.g. Path("artifacts/model.joblib").
     """
     joblib.dump(data, path)
-    logger.info(f"Binary file (joblib) saved at: {path}")
+    logger.info("Binary file (joblib) saved at: %s", path)
 
 
 
@@ -114,7 +114,7 @@ def load_bin(path: Union[Path, str]) -> Any:
         Any: The deserialized Python object (e.g. trained model).
     """
     obj = joblib.load(path)
-    logger.info(f"Binary file (joblib) loaded from: {path}")
+    logger.info("Binary file (joblib) loaded from: %s", path)
     return obj
 
 
@@ -132,7 +132,7 @@ def save_pickle(data: Any, path: Path) -> None:
     """
     with open(path, "wb") as f:
         pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
-    logger.info(f"Pickle file saved at: {path}")
+    logger.info("Pickle file saved at: %s", path)
 
 
 def load_pickle(path: Path) -> Any:
@@ -146,5 +146,5 @@ def load_pickle(path: Path) -> Any:
     """
     with open(path, "rb") as f:
         obj = pickle.load(f)
-    logger.info(f"Pickle file loaded from: {path}")
+    logger.info("Pickle file loaded from: %s", path)
     return obj
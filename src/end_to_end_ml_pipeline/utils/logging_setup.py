@@ -0,0 +1,162 @@
+import os
+import sys
+import copy
+import json
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from datetime import datetime, timezone
+
+# Opt-in switches, read once when the package is imported
+LOG_QUEUE_ENV = "PIPELINE_LOG_QUEUE"          # "1" -> QueueHandler/QueueListener, per-process files
+LOG_FORMAT_ENV = "PIPELINE_LOG_FORMAT"        # "json" -> one JSON object per line
+LOG_MAIN_PID_ENV = "PIPELINE_LOG_MAIN_PID"    # set by the first process; inherited by workers
+
+# Console handlers created by configure_logging; see send_console_to_stderr
+_console_handlers = []
+
+# Attributes every LogRecord has (plus our sampling hint); anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName", "sample_every"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as a single-line JSON object.
+
+    Fields passed through `extra=` are included as top-level keys, so
+    `logger.info("Train data shape: %s", shape, extra={"rows": n})` stays queryable.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in payload:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class _PreparedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that only does the minimum on the caller's thread.
+
+    The stock `prepare` runs a full formatter; here the message args are merged and
+    the traceback rendered to text, and all real formatting is left to the
+    listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only every Nth occurrence of a high-volume log call.
+
+    A call opts in with `extra={"sample_every": N}`; occurrences are counted per
+    (logger, message template). Records at WARNING and above are never dropped.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, "sample_every", 1)
+        if every <= 1 or record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % every == 0
+
+
+def process_log_file(log_dir: str, log_file_name: str) -> str:
+    """
+    Return the log file for the current process.
+
+    The first process to configure logging owns `log_file_name`; any process it
+    spawns (e.g. joblib/loky workers) writes to `<stem>.<pid><suffix>` instead, so
+    processes never interleave writes in the same file.
+    """
+    main_pid = os.environ.setdefault(LOG_MAIN_PID_ENV, str(os.getpid()))
+    if main_pid == str(os.getpid()):
+        return os.path.join(log_dir, log_file_name)
+    stem, suffix = os.path.splitext(log_file_name)
+    return os.path.join(log_dir, f"{stem}.{os.getpid()}{suffix}")
+
+
+def configure_logging(log_dir: str, log_file_name: str, fmt: str, level: int = logging.INFO) -> None:
+    """
+    Configure root logging for the package.
+
+    By default this is the plain synchronous file + stdout setup. Setting
+    PIPELINE_LOG_QUEUE=1 moves all handler I/O onto a background QueueListener
+    thread (callers only enqueue) and routes each process to its own file.
+    PIPELINE_LOG_FORMAT=json switches both handlers to JSON lines.
+
+    Args:
+        log_dir: Directory for log files; created if missing.
+        log_file_name: File name used by the main process.
+        fmt: Format string for the plain-text formatter.
+        level: Root logging level.
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    use_queue = os.environ.get(LOG_QUEUE_ENV, "").lower() in {"1", "true", "yes"}
+    use_json = os.environ.get(LOG_FORMAT_ENV, "").lower() == "json"
+
+    formatter = JsonFormatter() if use_json else logging.Formatter(fmt)
+    log_file_path = process_log_file(log_dir, log_file_name) if use_queue else os.path.join(log_dir, log_file_name)
+    console = logging.StreamHandler(sys.stdout)
+    _console_handlers.append(console)
+    handlers = [logging.FileHandler(log_file_path), console]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if not use_queue:
+        for handler in handlers:
+            handler.addFilter(SamplingFilter())
+        logging.basicConfig(level=level, handlers=handlers)
+        return
+
+    # SimpleQueue is unbounded, so put() never blocks the caller
+    log_queue = queue.SimpleQueue()
+    queue_handler = _PreparedQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+
+def send_console_to_stderr() -> None:
+    """
+    Point the console log handler at stderr instead of stdout.
+
+    For CLI commands whose stdout is data (e.g. JSON meant for a pipe), so log
+    lines never mix into it. The log file is unaffected.
+    """
+    for handler in _console_handlers:
+        handler.setStream(sys.stderr)